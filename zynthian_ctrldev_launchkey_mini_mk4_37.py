@@ -37,8 +37,10 @@
 #   Bank 2: CC passthrough (CC 24-31)
 # - Transport controls (Play, Record, Stop) with shift modifiers
 #******************************************************************************
-from time import sleep, time
-from threading import Timer
+from time import time
+from threading import Timer, Lock, Thread
+from queue import SimpleQueue
+from contextlib import contextmanager
 import logging
 
 # Zynthian specific modules
@@ -58,348 +60,403 @@ class zynthian_ctrldev_launchkey_mini_mk4_37(zynthian_ctrldev_zynpad, zynthian_c
     driver_description = "Interface Novation Launchkey Mini Mk4 with Zynthian"
     unroute_from_chains = True  # Prevent automatic routing, we'll handle keyboard notes explicitly
 
-    PAD_COLOURS = [71, 104, 76, 51, 104, 41, 64, 12, 11, 71, 4, 67, 42, 9, 105, 15]
+    PAD_COLOURS = bytes((71, 104, 76, 51, 104, 41, 64, 12, 11, 71, 4, 67, 42, 9, 105, 15))
     STARTING_COLOUR = 123
     STOPPING_COLOUR = 120
+
+    # Transport button CC => zynswitch index
+    _ZYNSWITCH_MAP = {74: 0, 75: 1, 76: 3, 77: 2}
+
+    # Navigation button CC => CUIA command (fired on button press)
+    _BUTTON_COMMANDS = {
+        105: "MENU",
+        106: "BACK",
+        107: "PRESET",
+        0x66: "ARROW_RIGHT",
+        0x67: "ARROW_LEFT"
+    }
+
+    # Navigation buttons to light up (not 51/52, those show bank state)
+    _NAV_CC_BUTTONS = (104, 105, 0x66, 0x67, 106, 107)
+
+    # Mixer control symbols that affect the pad LEDs
+    _LED_SYMBOLS = frozenset(('mute', 'solo'))
     
     # Function to initialise class
     def __init__(self, state_manager, idev_in, idev_out=None):
         self.shift = False
-        self.press_times = {}
+        self._press_t = [0.0] * 128  # Press timestamps indexed by CC number (0.0 = not pressed)
         self.knob_bank = 1  # Track current knob bank (0 = mixer, 1 = zynpot+CC, 2 = CC) - default to bank 1
         self.last_select_back_time = 0  # Debounce timer for SELECT/BACK knob
+        self._pad_led_cache = [None] * 24  # Last velocity sent per pad note (index = note - 96)
+        self._cc_tx = bytearray(3)  # Reusable buffer for the bank-2 CC passthrough (no per-tick allocation)
+        self._refresh_timer = None  # Pending coalescing timer for pad LED refresh
+        self._refresh_lock = Lock()
+        self._suspended = 0  # >0 while signal-driven LED refreshes are suspended
+        self._preset_cache = None  # (processor, preset_count) for knob-7 browsing, None when stale
+        self._screen_refresh_timer = None  # Pending batched screen refresh after preset browsing
+        self._init_timer = None  # Pending timer for the staged (non-blocking) device init
+        self._init_done = False
+        self._action_queue = SimpleQueue()  # Mixer/chain work deferred off the MIDI callback thread
+        self._worker_thread = None
+        # CC number => handler method, built once so midi_event dispatches in O(1)
+        self._cc_handlers = {
+            51: self._on_bank_prev,
+            52: self._on_bank_next,
+            0x3F: self._on_shift,
+            104: self._on_select_button,
+            74: self._on_transport,
+            75: self._on_transport,
+            76: self._on_transport,
+            77: self._on_transport,
+            0x73: self._on_play,
+            0x75: self._on_record,
+            105: self._on_nav_button,
+            106: self._on_nav_button,
+            107: self._on_nav_button,
+            0x66: self._on_nav_button,
+            0x67: self._on_nav_button,
+        }
         super().__init__(state_manager, idev_in, idev_out)
 
     def init(self):
-        # Enable DAW mode on launchkey
+        # Enable DAW mode on launchkey, then let the device settle without
+        # blocking the caller: the remaining stages run from single-shot timers
         lib_zyncore.dev_send_note_on(self.idev_out, 15, 12, 127)
-        sleep(0.2)
+        self._init_timer = Timer(0.2, self._init_stage2)
+        self._init_timer.start()
+
+    def _init_stage2(self):
         # Set encoders to Transport mode (relative mode)
         # Channel 7 (B6h = 182 decimal), CC 30 (1Eh = 30 decimal), Value 5 (Transport mode)
         lib_zyncore.dev_send_ccontrol_change(self.idev_out, 6, 30, 5)
-        sleep(0.1)
+        self._init_timer = Timer(0.1, self._init_stage3)
+        self._init_timer.start()
+
+    def _init_stage3(self):
+        self._init_timer = None
         self.cols = 8
         self.rows = 2
-        super().init()
-        # Light up navigation buttons
-        self.update_button_leds()
-        # Update pad LEDs immediately
-        self.update_pad_leds()
-        
+        # Collapse any refreshes fired during base-class init into the single
+        # refresh performed when the suspend context exits
+        with self._suspend_refresh():
+            super().init()
+            # Light up navigation buttons
+            self.update_button_leds()
+
         # Register callbacks for real-time updates using zynsigman
-        zynsigman.register_queued(zynsigman.S_CHAIN_MAN, self.chain_manager.SS_SET_ACTIVE_CHAIN, self.update_pad_leds)
-        zynsigman.register_queued(zynsigman.S_CHAIN_MAN, self.chain_manager.SS_MOVE_CHAIN, self.update_pad_leds)
+        zynsigman.register_queued(zynsigman.S_CHAIN_MAN, self.chain_manager.SS_SET_ACTIVE_CHAIN, self._on_active_chain)
+        zynsigman.register_queued(zynsigman.S_CHAIN_MAN, self.chain_manager.SS_MOVE_CHAIN, self._schedule_refresh)
         zynsigman.register_queued(zynsigman.S_AUDIO_MIXER, self.zynmixer.SS_ZCTRL_SET_VALUE, self.update_mixer_strip)
         zynsigman.register_queued(zynsigman.S_GUI, zynsigman.SS_GUI_SHOW_SCREEN, self.on_screen_change)
+        # Worker draining deferred controller actions (see _defer)
+        self._worker_thread = Thread(target=self._worker_loop, name="launchkey_mk4_worker", daemon=True)
+        self._worker_thread.start()
+        self._init_done = True
 
     def refresh(self):
         """Called when screen changes or chains are modified"""
-        # Update pad LEDs to reflect current mixer state
+        # Force a full redraw: drop the diff cache, then update pad LEDs
+        self._pad_led_cache = [None] * 24
+        self._schedule_refresh()
+
+    @contextmanager
+    def _suspend_refresh(self):
+        """Suspend signal-driven pad LED refreshes, running one refresh on exit"""
+        self._suspended += 1
+        try:
+            yield
+        finally:
+            self._suspended -= 1
+            if not self._suspended:
+                self.update_pad_leds()
+
+    def _schedule_refresh(self, *args, **kwargs):
+        """Schedule a coalesced pad LED refresh, collapsing signal bursts into one update"""
+        # Cheapest guards first: no output device means nothing to repaint,
+        # so don't even start a timer
+        if self._suspended or self.idev_out is None:
+            return
+        with self._refresh_lock:
+            if self._refresh_timer is None:
+                self._refresh_timer = Timer(0.02, self._do_refresh)
+                self._refresh_timer.start()
+
+    def _do_refresh(self):
+        """Timer target: clear the pending handle and run the actual refresh"""
+        with self._refresh_lock:
+            self._refresh_timer = None
         self.update_pad_leds()
 
+    def _on_active_chain(self, *args, **kwargs):
+        """Active chain changed: drop the preset-browse cache and refresh the pads"""
+        self._preset_cache = None
+        self._schedule_refresh()
+
+    def _schedule_screen_refresh(self):
+        """Batch the control/mixer screen redraws so a preset-knob burst redraws once"""
+        with self._refresh_lock:
+            if self._screen_refresh_timer is None:
+                self._screen_refresh_timer = Timer(0.1, self._do_screen_refresh)
+                self._screen_refresh_timer.start()
+
+    def _do_screen_refresh(self):
+        """Timer target: redraw the screens touched by preset browsing"""
+        with self._refresh_lock:
+            self._screen_refresh_timer = None
+        self.state_manager.send_cuia("refresh_screen", ["control"])
+        self.state_manager.send_cuia("refresh_screen", ["audio_mixer"])
+
     def update_button_leds(self):
         """Light up the navigation buttons and show bank state"""
-        if self.idev_out is None:
+        idev_out = self.idev_out
+        if idev_out is None:
             return
-        # Light up navigation buttons (not 51/52, those show bank state)
-        cc_buttons = [104, 105, 0x66, 0x67, 106, 107]
-        for cc in cc_buttons:
-            lib_zyncore.dev_send_ccontrol_change(self.idev_out, 0, cc, 127)
-        
-        # Update bank indicator LEDs
-        # Button 51 lights for bank 0, button 52 for bank 1, both off for bank 2
-        lib_zyncore.dev_send_ccontrol_change(self.idev_out, 0, 51, 127 if self.knob_bank == 0 else 0)
-        lib_zyncore.dev_send_ccontrol_change(self.idev_out, 0, 52, 127 if self.knob_bank == 1 else 0)
+        # Light up navigation buttons (static after startup, so sent once here)
+        send_cc = lib_zyncore.dev_send_ccontrol_change
+        for cc in self._NAV_CC_BUTTONS:
+            send_cc(idev_out, 0, cc, 127)
+        self._update_bank_leds()
+
+    def _update_bank_leds(self):
+        """Update the bank indicator LEDs only
+        Button 51 lights for bank 0, button 52 for bank 1, both off for bank 2"""
+        idev_out = self.idev_out
+        if idev_out is None:
+            return
+        lib_zyncore.dev_send_ccontrol_change(idev_out, 0, 51, 127 if self.knob_bank == 0 else 0)
+        lib_zyncore.dev_send_ccontrol_change(idev_out, 0, 52, 127 if self.knob_bank == 1 else 0)
 
     def end(self):
-        # Unregister signal callbacks
-        zynsigman.unregister(zynsigman.S_CHAIN_MAN, self.chain_manager.SS_SET_ACTIVE_CHAIN, self.update_pad_leds)
-        zynsigman.unregister(zynsigman.S_CHAIN_MAN, self.chain_manager.SS_MOVE_CHAIN, self.update_pad_leds)
-        zynsigman.unregister(zynsigman.S_AUDIO_MIXER, self.zynmixer.SS_ZCTRL_SET_VALUE, self.update_mixer_strip)
-        zynsigman.unregister(zynsigman.S_GUI, zynsigman.SS_GUI_SHOW_SCREEN, self.on_screen_change)
+        # Abort any in-flight staged init so teardown can't race setup
+        if self._init_timer is not None:
+            self._init_timer.cancel()
+            self._init_timer = None
+        # Stop the action worker
+        if self._worker_thread is not None:
+            self._action_queue.put(None)
+            self._worker_thread.join(timeout=1)
+            self._worker_thread = None
+        # Cancel any pending LED / screen refresh
+        with self._refresh_lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+            if self._screen_refresh_timer is not None:
+                self._screen_refresh_timer.cancel()
+                self._screen_refresh_timer = None
+        # Unregister signal callbacks (only registered once init completed)
+        if self._init_done:
+            zynsigman.unregister(zynsigman.S_CHAIN_MAN, self.chain_manager.SS_SET_ACTIVE_CHAIN, self._on_active_chain)
+            zynsigman.unregister(zynsigman.S_CHAIN_MAN, self.chain_manager.SS_MOVE_CHAIN, self._schedule_refresh)
+            zynsigman.unregister(zynsigman.S_AUDIO_MIXER, self.zynmixer.SS_ZCTRL_SET_VALUE, self.update_mixer_strip)
+            zynsigman.unregister(zynsigman.S_GUI, zynsigman.SS_GUI_SHOW_SCREEN, self.on_screen_change)
+            self._init_done = False
         super().end()
         # Disable DAW mode on launchkey
         lib_zyncore.dev_send_note_on(self.idev_out, 15, 12, 0)
+        # DAW-mode exit resets the hardware LEDs, so the diff cache is stale
+        self._pad_led_cache = [None] * 24
     
     def update_mixer_strip(self, chan, symbol, value):
         """Update pad LEDs when mixer values change (mute/solo)"""
         # Only update if it's a mute or solo change
-        if symbol in ['mute', 'solo']:
-            self.update_pad_leds()
-    
+        if symbol in self._LED_SYMBOLS:
+            self._schedule_refresh()
+
     def on_screen_change(self, screen):
         """Update pad LEDs when screen changes (catches chain add/remove)"""
         # Update LEDs when any screen is shown, as chains may have changed
-        self.update_pad_leds()
+        self._schedule_refresh()
     
+    @staticmethod
+    def _safe_mixer_chan(chain):
+        """Return the chain's regular mixer channel, or None for missing chains / master"""
+        if chain is None:
+            return None
+        # Chain objects always expose mixer_chan (possibly None)
+        mc = chain.mixer_chan
+        return mc if (mc is not None and mc < 16) else None
+
     def update_pad_leds(self):
         """Update pad LEDs based on mixer mute/solo state"""
-        if self.idev_out is None:
+        idev_out = self.idev_out
+        if idev_out is None:
             return
         
         try:
             # Verify chain_manager and zynmixer are available
             if not hasattr(self, 'chain_manager') or not hasattr(self, 'zynmixer'):
                 return
-            
-            # Update solo pads (top row: notes 96-103)
-            # Pads 0-6: chains 0-6 (excluding master), Pad 7: master channel (no solo for master)
-            for i in range(8):
-                note = 96 + i
-                try:
-                    if i < 7:
-                        # Pads 0-6: Regular chains (skip master channel if it appears in chain list)
-                        chain = self.chain_manager.get_chain_by_position(i, midi=False)
-                        
-                        if chain and hasattr(chain, 'mixer_chan') and chain.mixer_chan is not None and chain.mixer_chan < 16:
-                            mixer_chan = chain.mixer_chan
-                            is_soloed = self.zynmixer.get_solo(mixer_chan)
-                            vel = 14 if is_soloed else 118  # Yellow/orange if soloed, dim if not
-                        else:
-                            vel = 0  # No chain or master channel - LED off
-                    else:
-                        # Pad 7: Master channel - always off (no solo for master)
-                        vel = 0
-                except:
-                    vel = 0  # Error - LED off
-                
-                lib_zyncore.dev_send_note_on(self.idev_out, 0, note, vel)
-            
-            # Update mute pads (bottom row: notes 112-119)
-            # Pads 0-6: chains 0-6 (excluding master), Pad 7: master channel
-            for i in range(8):
-                note = 112 + i
-                try:
-                    if i < 7:
-                        # Pads 0-6: Regular chains (skip master channel if it appears in chain list)
-                        chain = self.chain_manager.get_chain_by_position(i, midi=False)
-                        
-                        if chain and hasattr(chain, 'mixer_chan') and chain.mixer_chan is not None and chain.mixer_chan < 16:
-                            mixer_chan = chain.mixer_chan
-                            is_muted = self.zynmixer.get_mute(mixer_chan)
-                            vel = 5 if is_muted else 64  # Red if muted, green if unmuted
-                        else:
-                            vel = 0  # No chain or master channel - LED off
+
+            # Bind hot attributes to locals (one lookup per refresh instead of per pad)
+            get_chain = self.chain_manager.get_chain_by_position
+            get_solo = self.zynmixer.get_solo
+            get_mute = self.zynmixer.get_mute
+            led_cache = self._pad_led_cache
+
+            # Snapshot chains 0-6 and their mixer channels once per refresh
+            # (skip master channel if it appears in chain list)
+            chains = [get_chain(i, midi=False) for i in range(7)]
+            mixer_chans = [self._safe_mixer_chan(c) for c in chains]
+
+            # Build the full (note, vel) plan in one pass, then write it out in a tight loop.
+            # Top row (notes 96-103): solo for chains 0-6, pad 7 off (no solo for master).
+            # Bottom row (notes 112-119): mute for chains 0-6, pad 7 = master (mixer channel 16).
+            if all(mc is None for mc in mixer_chans):
+                # No chains yet (common at boot): everything off except the
+                # master mute pad, without querying solo/mute per track
+                plan = [(96 + i, 0) for i in range(8)]
+                plan += [(112 + i, 0) for i in range(7)]
+            else:
+                plan = []
+                for i in range(7):
+                    mc = mixer_chans[i]
+                    if mc is not None:
+                        # Solo: yellow/orange if soloed, dim if not; Mute: red if muted, green if unmuted
+                        plan.append((96 + i, 14 if get_solo(mc) else 118))
+                        plan.append((112 + i, 5 if get_mute(mc) else 64))
                     else:
-                        # Pad 7: Master channel (mixer channel 16)
-                        is_muted = self.zynmixer.get_mute(16)
-                        vel = 5 if is_muted else 64  # Red if muted, green if unmuted
-                except:
-                    vel = 0  # Error - LED off
-                
-                lib_zyncore.dev_send_note_on(self.idev_out, 0, note, vel)
+                        plan.append((96 + i, 0))  # No chain - LED off
+                        plan.append((112 + i, 0))
+                plan.append((103, 0))  # Pad 7 top row: no solo for master
+            plan.append((119, 5 if get_mute(16) else 64))  # Pad 7 bottom row: master mute
+
+            # Only send pads whose LED state actually changed, packed into a
+            # single raw device write instead of one FFI call per pad
+            buf = bytearray()
+            for note, vel in plan:
+                if led_cache[note - 96] != vel:
+                    buf += bytes((0x90, note, vel))
+                    led_cache[note - 96] = vel
+            if buf:
+                lib_zyncore.dev_send_midi_event(idev_out, bytes(buf), len(buf))
         except Exception:
             # Silently fail if something goes wrong
             pass
 
+    def _worker_loop(self):
+        """Drain deferred controller actions; runs on its own thread"""
+        while True:
+            action = self._action_queue.get()
+            if action is None:
+                break
+            func, args = action
+            try:
+                func(*args)
+            except Exception as e:
+                logging.warning(f"Controller action error: {e}")
+
+    def _defer(self, func, *args):
+        """Queue func for the worker thread so the MIDI callback returns immediately
+        Falls back to running inline until init has started the worker"""
+        if self._worker_thread is not None:
+            self._action_queue.put((func, args))
+        else:
+            func(*args)
+
+    def _toggle_solo(self, track):
+        """Worker-side: toggle solo for the chain at the given position"""
+        chain = self.chain_manager.get_chain_by_position(track, midi=False)
+        if chain and chain.mixer_chan is not None and chain.mixer_chan < 16:
+            mixer_chan = chain.mixer_chan
+            self.zynmixer.set_solo(mixer_chan, 0 if self.zynmixer.get_solo(mixer_chan) else 1)
+            self._refresh_pad(track, 'solo', mixer_chan)
+
+    def _toggle_mute(self, track):
+        """Worker-side: toggle mute for the chain at the given position (7 = master)"""
+        if track < 7:
+            # Regular chains (skip master if it appears in chain list)
+            chain = self.chain_manager.get_chain_by_position(track, midi=False)
+            if chain and chain.mixer_chan is not None and chain.mixer_chan < 16:
+                mixer_chan = chain.mixer_chan
+                self.zynmixer.set_mute(mixer_chan, 0 if self.zynmixer.get_mute(mixer_chan) else 1)
+                self._refresh_pad(track, 'mute', mixer_chan)
+        else:
+            # Master channel (mixer channel 16)
+            self.zynmixer.set_mute(16, 0 if self.zynmixer.get_mute(16) else 1)
+            self._refresh_pad(7, 'mute', 16)
+
+    def _nudge_level(self, knob_index, delta):
+        """Worker-side: adjust a mixer level by a relative encoder delta"""
+        if knob_index < 7:
+            # Knobs 1-7: Regular chains (skip master if it appears in chain list)
+            chain = self.chain_manager.get_chain_by_position(knob_index, midi=False)
+            if chain and chain.mixer_chan is not None and chain.mixer_chan < 16:
+                mixer_chan = chain.mixer_chan
+            else:
+                return
+        else:
+            # Knob 8: Master channel (mixer channel 16)
+            mixer_chan = 16
+        current_level = self.zynmixer.get_level(mixer_chan)
+        self.zynmixer.set_level(mixer_chan, max(0.0, min(1.0, current_level + (delta * 0.01))))
+
+    def _refresh_pad(self, track, row, mixer_chan):
+        """Refresh a single pad LED after a local solo/mute toggle
+
+        The signal-driven full refresh still follows and catches any
+        side effects; this just gives immediate feedback for the pad
+        that was pressed without re-querying all chains."""
+        idev_out = self.idev_out
+        if idev_out is None:
+            return
+        if row == 'solo':
+            note = 96 + track
+            vel = 14 if self.zynmixer.get_solo(mixer_chan) else 118
+        else:
+            note = 112 + track
+            vel = 5 if self.zynmixer.get_mute(mixer_chan) else 64
+        if self._pad_led_cache[note - 96] != vel:
+            lib_zyncore.dev_send_note_on(idev_out, 0, note, vel)
+            self._pad_led_cache[note - 96] = vel
+
     def midi_event(self, ev):
-        evtype = (ev[0] >> 4) & 0x0F
-        ev_chan = ev[0] & 0x0F
-        
+        status = ev[0]
+        # Ignore System Realtime messages (clock, active sensing...) before any decoding
+        if status >= 0xF8:
+            return False
+        evtype = status >> 4  # High nibble (channel messages are always < 0xF8 here)
+        ev_chan = status & 0x0F
+
         # Handle note events (note-on and note-off)
         # Only process pad notes (96-119), let regular keyboard notes pass through
         if evtype == 0x9 or evtype == 0x8:
-            note = ev[1] & 0x7F
-            vel = ev[2] & 0x7F
-            
-            # Block ALL pad notes (96-119) from reaching synths by consuming the event
-            if 96 <= note <= 119:
-                # Process solo pads (96-102 only, pad 103 is master - no solo)
-                if 96 <= note <= 102 and evtype == 0x9 and vel > 0:
-                    # Top row (96-102): Solo control for chains 0-6 (excluding master)
-                    track = note - 96
-                    chain = self.chain_manager.get_chain_by_position(track, midi=False)
-                    
-                    if chain and chain.mixer_chan is not None and chain.mixer_chan < 16:
-                        mixer_chan = chain.mixer_chan
-                        current_solo = self.zynmixer.get_solo(mixer_chan)
-                        self.zynmixer.set_solo(mixer_chan, 0 if current_solo else 1)
-                        self.update_pad_leds()
-                
-                # Process mute pads (112-119)
-                elif 112 <= note <= 119 and evtype == 0x9 and vel > 0:
-                    # Bottom row: Pads 0-6 for chains 0-6 (excluding master), Pad 7 for master
-                    track = note - 112
-                    
-                    if track < 7:
-                        # Pads 0-6: Regular chains (skip master if it appears in chain list)
-                        chain = self.chain_manager.get_chain_by_position(track, midi=False)
-                        
-                        if chain and chain.mixer_chan is not None and chain.mixer_chan < 16:
-                            mixer_chan = chain.mixer_chan
-                            current_mute = self.zynmixer.get_mute(mixer_chan)
-                            self.zynmixer.set_mute(mixer_chan, 0 if current_mute else 1)
-                            self.update_pad_leds()
-                    else:
-                        # Pad 7: Master channel (mixer channel 16)
-                        current_mute = self.zynmixer.get_mute(16)
-                        self.zynmixer.set_mute(16, 0 if current_mute else 1)
-                        self.update_pad_leds()
-                
-                # Block ALL pad notes (96-119, both on and off) from reaching synths
-                return True
-            
-            # All other notes (keyboard) - explicitly route to chains
-            else:
+            # Keyboard fast path: most note events are not pads, so forward
+            # them before decoding anything else
+            # Work on the pad offset so each row test is a single compare
+            pad_off = (ev[1] & 0x7F) - 96
+            if pad_off < 0 or pad_off >= 24:
                 # Keyboard notes: send them through to the MIDI routing system
                 lib_zyncore.write_zynmidi(ev)
                 return True
+
+            # Block ALL pad notes (96-119) from reaching synths by consuming the event
+            vel = ev[2] & 0x7F
+            # Process solo pads (96-102 only, pad 103 is master - no solo)
+            if pad_off < 7 and evtype == 0x9 and vel > 0:
+                # Top row (96-102): Solo control for chains 0-6 (excluding master)
+                self._defer(self._toggle_solo, pad_off)
+
+            # Process mute pads (112-119)
+            elif pad_off >= 16 and evtype == 0x9 and vel > 0:
+                # Bottom row: Pads 0-6 for chains 0-6 (excluding master), Pad 7 for master
+                self._defer(self._toggle_mute, pad_off - 16)
+
+            # Block ALL pad notes (96-119, both on and off) from reaching synths
+            return True
         elif evtype == 0xB:
             ccnum = ev[1] & 0x7F
             ccval = ev[2] & 0x7F
-            
-            # Navigation button mappings (fire on button press)
-            button_commands = {
-                105: "MENU",
-                106: "BACK",
-                107: "PRESET",
-                0x66: "ARROW_RIGHT",
-                0x67: "ARROW_LEFT"
-            }
-            
-            # Buttons 51 and 52: Bank switching (normal), Arrow Up/Down (with shift)
-            if ccnum == 51 and ccval > 0:
-                if self.shift:
-                    self.state_manager.send_cuia("ARROW_UP")
-                else:
-                    self.knob_bank = (self.knob_bank - 1) % 3
-                    self.update_button_leds()
-                return True
-            elif ccnum == 52 and ccval > 0:
-                if self.shift:
-                    self.state_manager.send_cuia("ARROW_DOWN")
-                else:
-                    self.knob_bank = (self.knob_bank + 1) % 3
-                    self.update_button_leds()
-                return True
-            
-            # Physical shift button (CC 0x3F)
-            elif ccnum == 0x3F:
-                self.shift = ccval > 0
-                return True
 
-            # Button 104: ZYNSWITCH 3 with press duration detection
-            elif ccnum == 104:
-                if ccval > 0:
-                    self.press_times[ccnum] = time()
-                else:
-                    if ccnum in self.press_times:
-                        duration = time() - self.press_times[ccnum]
-                        press_type = 'S' if duration < 0.5 else 'B' if duration < 1.5 else 'L'
-                        self.state_manager.send_cuia("ZYNSWITCH", [3, press_type])
-                        del self.press_times[ccnum]
-                return True
             # Knobs 1-8 (CC 85-92): Behavior depends on current bank (Transport mode = relative)
-            elif 84 < ccnum < 93:
-                if self.knob_bank == 0:
-                    # Bank 0: Mixer channel levels
-                    # Knobs 1-7: chains 0-6 (excluding master), Knob 8: master channel
-                    knob_index = ccnum - 85  # 0-7
-                    
-                    # Convert relative encoder value to delta (Transport mode: 1/63 = CCW, 127/65 = CW)
-                    delta = -1 if ccval < 64 else 1 if ccval > 64 else 0
-                    
-                    if delta != 0:
-                        if knob_index < 7:
-                            # Knobs 1-7: Regular chains (skip master if it appears in chain list)
-                            chain = self.chain_manager.get_chain_by_position(knob_index, midi=False)
-                            if chain and chain.mixer_chan is not None and chain.mixer_chan < 16:
-                                mixer_chan = chain.mixer_chan
-                                current_level = self.zynmixer.get_level(mixer_chan)
-                                new_level = max(0.0, min(1.0, current_level + (delta * 0.01)))
-                                self.zynmixer.set_level(mixer_chan, new_level)
-                        else:
-                            # Knob 8: Master channel (mixer channel 16)
-                            current_level = self.zynmixer.get_level(16)
-                            new_level = max(0.0, min(1.0, current_level + (delta * 0.01)))
-                            self.zynmixer.set_level(16, new_level)
-                    return True
-                elif self.knob_bank == 1:
-                    # Bank 1: ZYNPOT 0-3, Arrow L/R, Arrow U/D, Presets, SELECT/BACK
-                    if 84 < ccnum < 89:
-                        # Knobs 1-4: ZYNPOT 0-3 (Zynthian's main rotary encoders)
-                        zynpot_index = ccnum - 85
-                        delta = -1 if ccval < 64 else 1 if ccval > 64 else 0
-                        
-                        if delta != 0:
-                            self.state_manager.send_cuia("ZYNPOT", [zynpot_index, delta])
-                        
-                        return True
-                    elif ccnum == 89:
-                        # Knob 5: Arrow Left/Right
-                        self.state_manager.send_cuia("ARROW_LEFT" if ccval < 64 else "ARROW_RIGHT")
-                        return True
-                    elif ccnum == 90:
-                        # Knob 6: Arrow Up/Down
-                        self.state_manager.send_cuia("ARROW_UP" if ccval < 64 else "ARROW_DOWN")
-                        return True
-                    elif ccnum == 91:
-                        # Knob 7: Preset browsing (previous/next with wraparound)
-                        delta = -1 if ccval < 64 else 1 if ccval > 64 else 0
-                        
-                        if delta != 0:
-                            try:
-                                chain = self.state_manager.chain_manager.get_active_chain()
-                                if chain and chain.current_processor:
-                                    processor = chain.current_processor
-                                    if hasattr(processor, 'preset_list') and processor.preset_list:
-                                        current_index = processor.preset_index if hasattr(processor, 'preset_index') else 0
-                                        new_index = (current_index + delta) % len(processor.preset_list)
-                                        processor.set_preset(new_index)
-                                        self.state_manager.send_cuia("refresh_screen", ["control"])
-                                        self.state_manager.send_cuia("refresh_screen", ["audio_mixer"])
-                            except Exception as e:
-                                logging.warning(f"Preset browsing error: {e}")
-                        return True
-                    elif ccnum == 92:
-                        # Knob 8: SELECT (CW) / BACK (CCW) with 600ms debounce
-                        current_time = time()
-                        if current_time - self.last_select_back_time < 0.6:
-                            return True
-                        self.last_select_back_time = current_time
-                        
-                        if ccval < 64:
-                            self.state_manager.send_cuia("BACK")
-                        elif ccval > 64:
-                            self.state_manager.send_cuia("ZYNSWITCH", [3, 'S'])
-                        return True
-                    return True
-                elif self.knob_bank == 2:
-                    # Bank 2: CC passthrough (85-92 → 24-31)
-                    lib_zyncore.write_zynmidi([0xB0 | ev_chan, ccnum - 61, ccval])
-                    return True
-            
-            # Transport buttons (CC 74-77): ZynSwitch with press duration detection
-            # Special case: Shift + CC 76 = TEMPO
-            elif ccnum in [74, 75, 76, 77]:
-                if self.shift and ccnum == 76 and ccval > 0:
-                    self.state_manager.send_cuia("TEMPO")
-                    return True
-                
-                zynswitch_index = {74: 0, 75: 1, 76: 3, 77: 2}[ccnum]
-                if ccval > 0:
-                    self.press_times[ccnum] = time()
-                elif ccnum in self.press_times:
-                    duration = time() - self.press_times[ccnum]
-                    press_type = 'S' if duration < 0.5 else 'B' if duration < 1.5 else 'L'
-                    self.state_manager.send_cuia("ZYNSWITCH", [zynswitch_index, press_type])
-                    del self.press_times[ccnum]
-                return True
+            if 84 < ccnum < 93:
+                return self._on_knob(ccnum, ccval, ev_chan)
 
-            # Play button (CC 0x73): PLAY (normal) / MIDI_PLAY (shift)
-            elif ccnum == 0x73 and ccval > 0:
-                self.state_manager.send_cuia("TOGGLE_MIDI_PLAY" if self.shift else "TOGGLE_PLAY")
-                return True
-            
-            # Record button (CC 0x75): RECORD (normal) / MIDI_RECORD (shift)
-            elif ccnum == 0x75 and ccval > 0:
-                self.state_manager.send_cuia("TOGGLE_MIDI_RECORD" if self.shift else "TOGGLE_RECORD")
-                return True
-            
-            # Navigation buttons: Send CUIA commands on button press
-            elif ccnum in button_commands and ccval > 0:
-                self.state_manager.send_cuia(button_commands[ccnum])
-                return True
+            # All other CCs: O(1) dispatch instead of walking an elif ladder
+            handler = self._cc_handlers.get(ccnum)
+            if handler:
+                return handler(ccnum, ccval)
 
         elif evtype == 0xC:
             val1 = ev[1] & 0x7F
@@ -408,4 +465,170 @@ class zynthian_ctrldev_launchkey_mini_mk4_37(zynthian_ctrldev_zynpad, zynthian_c
 
         # Let unhandled MIDI events pass through
         return False
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # CC event handlers (dispatched from midi_event via self._cc_handlers)
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _set_bank(self, new_bank):
+        """Switch knob bank, touching the indicator LEDs only when it actually changes"""
+        if new_bank == self.knob_bank:
+            return
+        self.knob_bank = new_bank
+        self._update_bank_leds()
+
+    def _on_bank_prev(self, ccnum, ccval):
+        """Button 51: Previous knob bank (normal), Arrow Up (with shift)"""
+        if ccval > 0:
+            if self.shift:
+                self.state_manager.send_cuia("ARROW_UP")
+            else:
+                self._set_bank((self.knob_bank - 1) % 3)
+            return True
+        return False
+
+    def _on_bank_next(self, ccnum, ccval):
+        """Button 52: Next knob bank (normal), Arrow Down (with shift)"""
+        if ccval > 0:
+            if self.shift:
+                self.state_manager.send_cuia("ARROW_DOWN")
+            else:
+                self._set_bank((self.knob_bank + 1) % 3)
+            return True
+        return False
+
+    def _on_shift(self, ccnum, ccval):
+        """Physical shift button (CC 0x3F)"""
+        self.shift = ccval > 0
+        return True
+
+    def _handle_press_release(self, ccnum, ccval, zynswitch_index):
+        """Track button press/release timing and fire ZYNSWITCH with S/B/L duration"""
+        if ccval > 0:
+            self._press_t[ccnum] = time()
+        else:
+            t0 = self._press_t[ccnum]
+            if t0:
+                duration = time() - t0
+                self._press_t[ccnum] = 0.0
+                press_type = 'S' if duration < 0.5 else 'B' if duration < 1.5 else 'L'
+                self.state_manager.send_cuia("ZYNSWITCH", [zynswitch_index, press_type])
+        return True
+
+    def _on_select_button(self, ccnum, ccval):
+        """Button 104: ZYNSWITCH 3 with press duration detection"""
+        return self._handle_press_release(ccnum, ccval, 3)
+
+    def _on_transport(self, ccnum, ccval):
+        """Transport buttons (CC 74-77): ZynSwitch with press duration detection
+        Special case: Shift + CC 76 = TEMPO"""
+        if self.shift and ccnum == 76 and ccval > 0:
+            self.state_manager.send_cuia("TEMPO")
+            return True
+        return self._handle_press_release(ccnum, ccval, self._ZYNSWITCH_MAP[ccnum])
+
+    def _on_play(self, ccnum, ccval):
+        """Play button (CC 0x73): PLAY (normal) / MIDI_PLAY (shift)"""
+        if ccval > 0:
+            self.state_manager.send_cuia("TOGGLE_MIDI_PLAY" if self.shift else "TOGGLE_PLAY")
+            return True
+        return False
+
+    def _on_record(self, ccnum, ccval):
+        """Record button (CC 0x75): RECORD (normal) / MIDI_RECORD (shift)"""
+        if ccval > 0:
+            self.state_manager.send_cuia("TOGGLE_MIDI_RECORD" if self.shift else "TOGGLE_RECORD")
+            return True
+        return False
+
+    def _on_nav_button(self, ccnum, ccval):
+        """Navigation buttons: Send CUIA commands on button press"""
+        if ccval > 0:
+            self.state_manager.send_cuia(self._BUTTON_COMMANDS[ccnum])
+            return True
+        return False
+
+    @staticmethod
+    def _enc_delta(ccval):
+        """Decode a relative encoder value to a delta (Transport mode: 1/63 = CCW, 127/65 = CW)"""
+        return -1 if ccval < 64 else 1 if ccval > 64 else 0
+
+    def _on_knob(self, ccnum, ccval, ev_chan):
+        """Knobs 1-8 (CC 85-92): Behavior depends on current bank (Transport mode = relative)"""
+        if self.knob_bank == 0:
+            # Bank 0: Mixer channel levels
+            # Knobs 1-7: chains 0-6 (excluding master), Knob 8: master channel
+            knob_index = ccnum - 85  # 0-7
+            delta = self._enc_delta(ccval)
+
+            if delta != 0:
+                self._defer(self._nudge_level, knob_index, delta)
+            return True
+        elif self.knob_bank == 1:
+            # Bank 1: ZYNPOT 0-3, Arrow L/R, Arrow U/D, Presets, SELECT/BACK
+            if 84 < ccnum < 89:
+                # Knobs 1-4: ZYNPOT 0-3 (Zynthian's main rotary encoders)
+                zynpot_index = ccnum - 85
+                delta = self._enc_delta(ccval)
+                
+                if delta != 0:
+                    self.state_manager.send_cuia("ZYNPOT", [zynpot_index, delta])
+                
+                return True
+            elif ccnum == 89:
+                # Knob 5: Arrow Left/Right
+                self.state_manager.send_cuia("ARROW_LEFT" if ccval < 64 else "ARROW_RIGHT")
+                return True
+            elif ccnum == 90:
+                # Knob 6: Arrow Up/Down
+                self.state_manager.send_cuia("ARROW_UP" if ccval < 64 else "ARROW_DOWN")
+                return True
+            elif ccnum == 91:
+                # Knob 7: Preset browsing (previous/next with wraparound)
+                delta = self._enc_delta(ccval)
+
+                if delta != 0:
+                    cache = self._preset_cache
+                    if cache is None:
+                        # Revalidate the processor once per active-chain change,
+                        # not on every encoder tick
+                        try:
+                            chain = self.state_manager.chain_manager.get_active_chain()
+                            if chain and chain.current_processor:
+                                processor = chain.current_processor
+                                if hasattr(processor, 'preset_list') and processor.preset_list:
+                                    cache = self._preset_cache = (processor, len(processor.preset_list))
+                        except Exception as e:
+                            logging.warning(f"Preset browsing error: {e}")
+                    if cache:
+                        processor, preset_count = cache
+                        try:
+                            current_index = processor.preset_index if hasattr(processor, 'preset_index') else 0
+                            processor.set_preset((current_index + delta) % preset_count)
+                            self._schedule_screen_refresh()
+                        except Exception as e:
+                            logging.warning(f"Preset browsing error: {e}")
+                            self._preset_cache = None
+                return True
+            elif ccnum == 92:
+                # Knob 8: SELECT (CW) / BACK (CCW) with 600ms debounce
+                current_time = time()
+                if current_time - self.last_select_back_time < 0.6:
+                    return True
+                self.last_select_back_time = current_time
+                
+                if ccval < 64:
+                    self.state_manager.send_cuia("BACK")
+                elif ccval > 64:
+                    self.state_manager.send_cuia("ZYNSWITCH", [3, 'S'])
+                return True
+            return True
+        elif self.knob_bank == 2:
+            # Bank 2: CC passthrough (85-92 → 24-31), reusing the preallocated buffer
+            self._cc_tx[0] = 0xB0 | ev_chan
+            self._cc_tx[1] = ccnum - 61
+            self._cc_tx[2] = ccval
+            lib_zyncore.write_zynmidi(self._cc_tx)
+            return True
+        return False
 # ------------------------------------------------------------------------------------------------------------------